@@ -92,11 +92,17 @@ def circuit_to_dag(circuit, copy_operations=True, *, qubit_order=None, clbit_ord
     for register in circuit.cregs:
         dagcircuit.add_creg(register)
 
+    # Bind the loop-invariant lookups locally; this loop runs once per instruction.
+    deepcopy = copy.deepcopy
+    apply_operation_back = dagcircuit.apply_operation_back
     for instruction in circuit.data:
         op = instruction.operation
-        if copy_operations:
-            op = copy.deepcopy(op)
-        dagcircuit.apply_operation_back(op, instruction.qubits, instruction.clbits, check=False)
+        # Each node gets its own copy of a mutable operation, even if the same instance appears
+        # several times in the circuit, because passes may modify `node.op` in place.  Immutable
+        # singleton instances are shared rather than copied, so skip `deepcopy` for them.
+        if copy_operations and getattr(op, "mutable", True):
+            op = deepcopy(op)
+        apply_operation_back(op, instruction.qubits, instruction.clbits, check=False)
 
     dagcircuit.duration = circuit.duration
     dagcircuit.unit = circuit.unit
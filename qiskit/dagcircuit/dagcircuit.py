@@ -299,16 +299,15 @@ class DAGCircuit:
         if qreg.name in self.qregs:
             raise DAGCircuitError("duplicate register %s" % qreg.name)
         self.qregs[qreg.name] = qreg
-        existing_qubits = set(self.qubits)
-        for j in range(qreg.size):
-            if qreg[j] in self._qubit_indices:
-                self._qubit_indices[qreg[j]].registers.append((qreg, j))
-            if qreg[j] not in existing_qubits:
-                self.qubits.append(qreg[j])
-                self._qubit_indices[qreg[j]] = BitLocations(
+        for j, qubit in enumerate(qreg):
+            if (locations := self._qubit_indices.get(qubit)) is not None:
+                locations.registers.append((qreg, j))
+            else:
+                self.qubits.append(qubit)
+                self._qubit_indices[qubit] = BitLocations(
                     len(self.qubits) - 1, registers=[(qreg, j)]
                 )
-                self._add_wire(qreg[j])
+                self._add_wire(qubit)
 
     def add_creg(self, creg):
         """Add all wires in a classical register."""
@@ -317,16 +316,15 @@ class DAGCircuit:
         if creg.name in self.cregs:
             raise DAGCircuitError("duplicate register %s" % creg.name)
         self.cregs[creg.name] = creg
-        existing_clbits = set(self.clbits)
-        for j in range(creg.size):
-            if creg[j] in self._clbit_indices:
-                self._clbit_indices[creg[j]].registers.append((creg, j))
-            if creg[j] not in existing_clbits:
-                self.clbits.append(creg[j])
-                self._clbit_indices[creg[j]] = BitLocations(
+        for j, clbit in enumerate(creg):
+            if (locations := self._clbit_indices.get(clbit)) is not None:
+                locations.registers.append((creg, j))
+            else:
+                self.clbits.append(clbit)
+                self._clbit_indices[clbit] = BitLocations(
                     len(self.clbits) - 1, registers=[(creg, j)]
                 )
-                self._add_wire(creg[j])
+                self._add_wire(clbit)
 
     def add_input_var(self, var: expr.Var):
         """Add an input variable to the circuit.
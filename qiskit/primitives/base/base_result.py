@@ -30,6 +30,10 @@ class _BasePrimitiveResult(ABC):
     Base class for deprecated Primitive result methods.
     """
 
+    # Empty so that subclasses declaring ``__slots__`` (such as ``SamplerResult``) have no
+    # ``__dict__``.  Subclasses that do not declare ``__slots__`` keep a ``__dict__`` as usual.
+    __slots__ = ()
+
     def __post_init__(self) -> None:
         """
         Verify that all fields in any inheriting result dataclass are consistent, after
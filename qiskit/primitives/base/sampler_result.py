@@ -18,6 +18,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 from qiskit.result import QuasiDistribution
 
 from .base_result import _BasePrimitiveResult
@@ -41,5 +43,61 @@ class SamplerResult(_BasePrimitiveResult):
         metadata (list[dict]): List of the metadata.
     """
 
+    # Results are often kept in large numbers (e.g. over the iterations of a variational
+    # algorithm), so avoid a per-instance ``__dict__``.  ``dataclass(slots=True)`` needs Python 3.10.
+    __slots__ = ("quasi_dists", "metadata", "__weakref__")
+
     quasi_dists: list[QuasiDistribution]
     metadata: list[dict[str, Any]]
+
+    def __getstate__(self):
+        # Use the dataclass fields rather than ``__slots__``, so fields added by subclasses are kept,
+        # along with any other attributes a subclass without ``__slots__`` stores in its
+        # ``__dict__``.  Non-field attributes held in extra slots of a subclass are not kept.
+        fields = {name: getattr(self, name) for name in self._field_names}
+        return {**getattr(self, "__dict__", {}), **fields}
+
+    def __setstate__(self, state):
+        # The default state restoration goes through the frozen ``__setattr__`` and fails.
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def as_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the quasi-distributions as a pair of dense, zero-padded arrays.
+
+        Row ``i`` of the first array holds the integer outcomes of ``quasi_dists[i]``, and the same
+        positions of the second array hold their quasi-probabilities.  Rows are padded up to the
+        size of the largest distribution with outcome ``0`` and quasi-probability ``0.0``, so the
+        padding does not contribute to any sum weighted by the quasi-probabilities.  For example,
+        the expectation values of a diagonal observable given as an array ``diagonal`` of its
+        eigenvalues for every outcome can be computed for all the experiments at once with:
+
+        .. code-block:: python
+
+            outcomes, probabilities = result.as_arrays()
+            values = np.sum(probabilities * diagonal[outcomes], axis=1)
+
+        Returns:
+            A tuple ``(outcomes, probabilities)`` of arrays of shape
+            ``(num_experiments, max_num_outcomes)``, with dtypes ``int64`` and ``float64``
+            respectively.
+
+        Raises:
+            ValueError: if an outcome does not fit in a signed 64-bit integer, i.e. it is
+                ``2**63`` or larger, which can happen for circuits with 64 or more classical bits.
+        """
+        num_outcomes = max((len(dist) for dist in self.quasi_dists), default=0)
+        outcomes = np.zeros((len(self.quasi_dists), num_outcomes), dtype=np.int64)
+        probabilities = np.zeros((len(self.quasi_dists), num_outcomes), dtype=np.float64)
+        for i, dist in enumerate(self.quasi_dists):
+            try:
+                outcomes[i, : len(dist)] = np.fromiter(dist.keys(), dtype=np.int64, count=len(dist))
+            except OverflowError as ex:
+                raise ValueError(
+                    f"quasi_dists[{i}] has an outcome too large for a signed 64-bit integer."
+                    " 'as_arrays' only supports outcomes smaller than 2**63."
+                ) from ex
+            probabilities[i, : len(dist)] = np.fromiter(
+                dist.values(), dtype=np.float64, count=len(dist)
+            )
+        return outcomes, probabilities
@@ -253,7 +253,7 @@ class Statevector(QuantumState, TolerancesMixin):
 
     def trace(self) -> np.float64:
         """Return the trace of the quantum state as a density matrix."""
-        return np.sum(np.abs(self.data) ** 2)
+        return np.vdot(self.data, self.data).real
 
     def purity(self) -> np.float64:
         """Return the purity of the quantum state."""
@@ -586,9 +586,10 @@ class Statevector(QuantumState, TolerancesMixin):
                 Swapped probs: [0.5 0.5 0.  0. ]
 
         """
-        probs = self._subsystem_probabilities(
-            np.abs(self.data) ** 2, self._op_shape.dims_l(), qargs=qargs
-        )
+        # Square in place to avoid allocating a second temporary of the full state size.
+        probs = np.abs(self.data)
+        np.square(probs, out=probs)
+        probs = self._subsystem_probabilities(probs, self._op_shape.dims_l(), qargs=qargs)
 
         # to account for roundoff errors, we clip
         probs = np.clip(probs, a_min=0, a_max=1)
@@ -16,7 +16,7 @@ import unittest
 
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.circuit import QuantumRegister, ClassicalRegister, QuantumCircuit, Clbit, SwitchCaseOp
-from qiskit.circuit.library import HGate, Measure
+from qiskit.circuit.library import HGate, Measure, RZGate, SwapGate
 from qiskit.circuit.classical import expr, types
 from qiskit.converters import dag_to_circuit, circuit_to_dag
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
@@ -182,6 +182,44 @@ class TestCircuitToDag(QiskitTestCase):
         with self.assertRaisesRegex(ValueError, "does not contain exactly the same"):
             circuit_to_dag(qc, clbit_order=cr[[0, 1, 1]])
 
+    def test_copy_operations_shared_instances(self):
+        """Test that a mutable operation shared between instructions is copied separately for
+        each DAG node, so modifying one node does not affect the others."""
+        gate = RZGate(0.5)
+        qc = QuantumCircuit(2)
+        qc.append(gate, [0])
+        qc.append(gate, [1])
+        qc.append(RZGate(0.5), [0])
+
+        dag = circuit_to_dag(qc)
+        first, second, _ = (node.op for node in dag.topological_op_nodes())
+        self.assertIsNot(first, gate)
+        self.assertIsNot(second, gate)
+        self.assertIsNot(first, second)
+        first.label = "modified"
+        self.assertIsNone(second.label)
+        self.assertIsNone(gate.label)
+
+        dag = circuit_to_dag(qc, copy_operations=False)
+        first, second, _ = (node.op for node in dag.topological_op_nodes())
+        self.assertIs(first, gate)
+        self.assertIs(second, gate)
+
+    def test_copy_operations_keeps_singletons(self):
+        """Test that immutable singleton gates are not duplicated by copying the operations, so
+        every node of the same standard gate shares a single instance."""
+        qc = QuantumCircuit(3)
+        for qubit in qc.qubits:
+            qc.h(qubit)
+        qc.swap(0, 1)
+        qc.swap(1, 2)
+
+        dag = circuit_to_dag(qc)
+        h_ops = {id(node.op) for node in dag.op_nodes(HGate)}
+        swap_ops = {id(node.op) for node in dag.op_nodes(SwapGate)}
+        self.assertEqual(h_ops, {id(HGate())})
+        self.assertEqual(swap_ops, {id(SwapGate())})
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
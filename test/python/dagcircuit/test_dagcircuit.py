@@ -299,6 +299,44 @@ class TestDagRegisters(QiskitTestCase):
         self.assertEqual(single_cl_bit_res.index, 3)
         self.assertEqual(single_cl_bit_res.registers, [])
 
+    def test_add_qreg_overlapping_existing_bits(self):
+        """Test adding quantum registers whose bits are partly already in the DAG."""
+        a, b, c = Qubit(), Qubit(), Qubit()
+        dag = DAGCircuit()
+        dag.add_qubits([a, b])
+        qr1 = QuantumRegister(bits=[b, c], name="qr1")
+        qr2 = QuantumRegister(bits=[c, a], name="qr2")
+        dag.add_qreg(qr1)
+        dag.add_qreg(qr2)
+
+        self.assertEqual(dag.qubits, [a, b, c])
+        self.assertEqual(set(dag.input_map), {a, b, c})
+        self.assertEqual(dag.find_bit(a).index, 0)
+        self.assertEqual(dag.find_bit(a).registers, [(qr2, 1)])
+        self.assertEqual(dag.find_bit(b).index, 1)
+        self.assertEqual(dag.find_bit(b).registers, [(qr1, 0)])
+        self.assertEqual(dag.find_bit(c).index, 2)
+        self.assertEqual(dag.find_bit(c).registers, [(qr1, 1), (qr2, 0)])
+
+    def test_add_creg_overlapping_existing_bits(self):
+        """Test adding classical registers whose bits are partly already in the DAG."""
+        a, b, c = Clbit(), Clbit(), Clbit()
+        dag = DAGCircuit()
+        dag.add_clbits([a, b])
+        cr1 = ClassicalRegister(bits=[b, c], name="cr1")
+        cr2 = ClassicalRegister(bits=[c, a], name="cr2")
+        dag.add_creg(cr1)
+        dag.add_creg(cr2)
+
+        self.assertEqual(dag.clbits, [a, b, c])
+        self.assertEqual(set(dag.input_map), {a, b, c})
+        self.assertEqual(dag.find_bit(a).index, 0)
+        self.assertEqual(dag.find_bit(a).registers, [(cr2, 1)])
+        self.assertEqual(dag.find_bit(b).index, 1)
+        self.assertEqual(dag.find_bit(b).registers, [(cr1, 0)])
+        self.assertEqual(dag.find_bit(c).index, 2)
+        self.assertEqual(dag.find_bit(c).registers, [(cr1, 1), (cr2, 0)])
+
     def test_find_bit_missing(self):
         """Test error when find_bit is called with missing bit."""
         qr = QuantumRegister(3, "qr")
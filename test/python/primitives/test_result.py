@@ -14,12 +14,18 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+import weakref
 from collections.abc import Collection
 from dataclasses import dataclass
 from typing import Any
 from ddt import data, ddt, unpack
+import numpy as np
 
+from qiskit.primitives import SamplerResult
 from qiskit.primitives.base.base_result import _BasePrimitiveResult as BasePrimitiveResult
+from qiskit.result import QuasiDistribution
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
 
 
@@ -34,6 +40,13 @@ class Result(BasePrimitiveResult):
     field_2: Collection[Any]
 
 
+@dataclass(frozen=True)
+class ExtendedSamplerResult(SamplerResult):
+    """Dummy subclass of SamplerResult adding a field."""
+
+    extra: list[int]
+
+
 ################################################################################
 ## TESTS
 ################################################################################
@@ -63,3 +76,64 @@ class TestBasePrimitiveResult(QiskitTestCase):
         """Tests field values ({field_1}, {field_2})."""
         result = Result(field_1, field_2)
         self.assertEqual(result._field_values, (field_1, field_2))
+
+
+class TestSamplerResult(QiskitTestCase):
+    """Tests SamplerResult."""
+
+    def test_as_arrays(self):
+        """Tests the padded array view of the quasi-distributions."""
+        result = SamplerResult(
+            [QuasiDistribution({0: 0.25, 3: 0.75}), QuasiDistribution({1: 1.0})], [{}, {}]
+        )
+        outcomes, probabilities = result.as_arrays()
+        np.testing.assert_array_equal(outcomes, [[0, 3], [1, 0]])
+        np.testing.assert_allclose(probabilities, [[0.25, 0.75], [1.0, 0.0]])
+
+        diagonal = np.array([1.0, -1.0, -1.0, 1.0])
+        np.testing.assert_allclose(np.sum(probabilities * diagonal[outcomes], axis=1), [1.0, -1.0])
+
+    def test_as_arrays_wide_outcomes(self):
+        """Tests that outcomes that do not fit in 64-bit integers raise a clear error."""
+        result = SamplerResult(
+            [QuasiDistribution({1: 1.0}), QuasiDistribution({2**63 + 5: 1.0})], [{}, {}]
+        )
+        with self.assertRaisesRegex(ValueError, "2\\*\\*63"):
+            result.as_arrays()
+
+        result = SamplerResult([QuasiDistribution({2**63 - 1: 1.0})], [{}])
+        outcomes, _ = result.as_arrays()
+        np.testing.assert_array_equal(outcomes, [[2**63 - 1]])
+
+    def test_as_arrays_empty(self):
+        """Tests the array view of a result with no experiments."""
+        outcomes, probabilities = SamplerResult([], []).as_arrays()
+        self.assertEqual(outcomes.shape, (0, 0))
+        self.assertEqual(probabilities.shape, (0, 0))
+
+    def test_no_instance_dict_and_pickle(self):
+        """Tests that the result has no instance dictionary and still roundtrips through pickle."""
+        result = SamplerResult([QuasiDistribution({0: 0.5, 1: 0.5})], [{"shots": 100}])
+        self.assertFalse(hasattr(result, "__dict__"))
+        self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+
+    def test_subclass_pickle(self):
+        """Tests that fields added by a dataclass subclass survive pickling and copying."""
+        result = ExtendedSamplerResult([QuasiDistribution({0: 1.0})], [{}], [3])
+        for roundtripped in (pickle.loads(pickle.dumps(result)), copy.deepcopy(result)):
+            self.assertIsInstance(roundtripped, ExtendedSamplerResult)
+            self.assertEqual(roundtripped, result)
+            self.assertEqual(roundtripped.extra, [3])
+
+    def test_subclass_pickle_non_field_attribute(self):
+        """Tests that non-field attributes of a subclass instance survive pickling and copying."""
+        result = ExtendedSamplerResult([QuasiDistribution({0: 1.0})], [{}], [3])
+        object.__setattr__(result, "note", "kept")
+        for roundtripped in (pickle.loads(pickle.dumps(result)), copy.deepcopy(result)):
+            self.assertEqual(roundtripped, result)
+            self.assertEqual(roundtripped.note, "kept")
+
+    def test_weakref(self):
+        """Tests that results still support weak references."""
+        result = SamplerResult([QuasiDistribution({0: 1.0})], [{}])
+        self.assertIs(weakref.ref(result)(), result)